@@ -557,8 +557,12 @@ class TableVectorizer(ColumnTransformer):
         # Convert to the best possible data type
         self.types_ = {}
         for col in X.columns:
-            if not pd.api.types.is_datetime64_any_dtype(X[col]):
-                # we don't want to cast datetime64
+            # we don't want to cast datetime64, and numeric columns
+            # are already numeric, so only try the remaining ones
+            if not (
+                pd.api.types.is_datetime64_any_dtype(X[col])
+                or pd.api.types.is_numeric_dtype(X[col])
+            ):
                 try:
                     X[col] = pd.to_numeric(X[col], errors="raise")
                 except (ValueError, TypeError):
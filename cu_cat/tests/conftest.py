@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+
+@pytest.fixture(scope="session")
+def clean_df() -> pd.DataFrame:
+    """
+    Creates a simple DataFrame with various types of data,
+    and without missing values.
+    Shared across the session: copy it before mutating.
+    """
+    return pd.DataFrame(
+        {
+            "int": pd.Series([15, 56, 63, 12, 44], dtype="int"),
+            "float": pd.Series([5.2, 2.4, 6.2, 10.45, 9.0], dtype="float"),
+            "str1": pd.Series(
+                ["public", "private", "private", "private", "public"], dtype="string"
+            ),
+            "str2": pd.Series(
+                ["officer", "manager", "lawyer", "chef", "teacher"], dtype="string"
+            ),
+            "cat1": pd.Series(["yes", "yes", "no", "yes", "no"], dtype="category"),
+            "cat2": pd.Series(
+                ["20K+", "40K+", "60K+", "30K+", "50K+"], dtype="category"
+            ),
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def dirty_df() -> pd.DataFrame:
+    """
+    Creates a simple DataFrame with some missing values.
+    We'll use different types of missing values (np.nan, pd.NA, None)
+    to test the robustness of the vectorizer.
+    Shared across the session: copy it before mutating.
+    """
+    return pd.DataFrame(
+        {
+            "int": pd.Series([15, 56, pd.NA, 12, 44], dtype="Int64"),
+            "float": pd.Series([5.2, 2.4, 6.2, 10.45, np.nan], dtype="Float64"),
+            "str1": pd.Series(
+                ["public", np.nan, "private", "private", "public"], dtype="object"
+            ),
+            "str2": pd.Series(
+                ["officer", "manager", None, "chef", "teacher"], dtype="object"
+            ),
+            "cat1": pd.Series([np.nan, "yes", "no", "yes", "no"], dtype="object"),
+            "cat2": pd.Series(
+                ["20K+", "40K+", "60K+", "30K+", np.nan], dtype="object"
+            ),
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def dirty_category_df(dirty_df) -> pd.DataFrame:
+    """
+    Returns a copy of `dirty_df` with its string columns
+    cast to the category dtype.
+    Shared across the session: copy it before mutating.
+    """
+    return dirty_df.astype(
+        {col: "category" for col in ["str1", "str2", "cat1", "cat2"]}
+    )
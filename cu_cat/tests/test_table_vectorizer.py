@@ -40,57 +40,6 @@ def type_equality(expected_type, actual_type) -> bool:
         return expected_type == actual_type
 
 
-def _get_clean_dataframe() -> pd.DataFrame:
-    """
-    Creates a simple DataFrame with various types of data,
-    and without missing values.
-    """
-    return pd.DataFrame(
-        {
-            "int": pd.Series([15, 56, 63, 12, 44], dtype="int"),
-            "float": pd.Series([5.2, 2.4, 6.2, 10.45, 9.0], dtype="float"),
-            "str1": pd.Series(
-                ["public", "private", "private", "private", "public"], dtype="string"
-            ),
-            "str2": pd.Series(
-                ["officer", "manager", "lawyer", "chef", "teacher"], dtype="string"
-            ),
-            "cat1": pd.Series(["yes", "yes", "no", "yes", "no"], dtype="category"),
-            "cat2": pd.Series(
-                ["20K+", "40K+", "60K+", "30K+", "50K+"], dtype="category"
-            ),
-        }
-    )
-
-
-def _get_dirty_dataframe(categorical_dtype="object") -> pd.DataFrame:
-    """
-    Creates a simple DataFrame with some missing values.
-    We'll use different types of missing values (np.nan, pd.NA, None)
-    to test the robustness of the vectorizer.
-    """
-    return pd.DataFrame(
-        {
-            "int": pd.Series([15, 56, pd.NA, 12, 44], dtype="Int64"),
-            "float": pd.Series([5.2, 2.4, 6.2, 10.45, np.nan], dtype="Float64"),
-            "str1": pd.Series(
-                ["public", np.nan, "private", "private", "public"],
-                dtype=categorical_dtype,
-            ),
-            "str2": pd.Series(
-                ["officer", "manager", None, "chef", "teacher"],
-                dtype=categorical_dtype,
-            ),
-            "cat1": pd.Series(
-                [np.nan, "yes", "no", "yes", "no"], dtype=categorical_dtype
-            ),
-            "cat2": pd.Series(
-                ["20K+", "40K+", "60K+", "30K+", np.nan], dtype=categorical_dtype
-            ),
-        }
-    )
-
-
 def _get_mixed_types_dataframe() -> pd.DataFrame:
     return pd.DataFrame(
         {
@@ -126,8 +75,11 @@ def _test_possibilities(X) -> None:
     # Test with low cardinality and a StandardScaler for the numeric columns
     vectorizer_base = TableVectorizer(
         cardinality_threshold=4,
-        # we must have n_samples = 5 >= n_components
-        high_card_cat_transformer=GapEncoder(n_components=2),
+        # we must have n_samples = 5 >= n_components;
+        # only the column routing is checked, so a single pass is enough
+        high_card_cat_transformer=GapEncoder(
+            n_components=2, max_iter=1, batch_size=1024
+        ),
         numerical_transformer=StandardScaler(),
     )
     # Warning: order-dependant
@@ -158,8 +110,11 @@ def _test_possibilities(X) -> None:
     # Test casting values
     vectorizer_cast = TableVectorizer(
         cardinality_threshold=4,
-        # we must have n_samples = 5 >= n_components
-        high_card_cat_transformer=GapEncoder(n_components=2),
+        # we must have n_samples = 5 >= n_components;
+        # only the column routing is checked, so a single pass is enough
+        high_card_cat_transformer=GapEncoder(
+            n_components=2, max_iter=1, batch_size=1024
+        ),
         numerical_transformer=StandardScaler(),
     )
     X_str = X.astype("object")
@@ -183,25 +138,25 @@ def _test_possibilities(X) -> None:
     )
 
 
-def test_with_clean_data() -> None:
+def test_with_clean_data(clean_df) -> None:
     """
     Defines the expected returns of the vectorizer in different settings,
     and runs the tests with a clean dataset.
     """
-    _test_possibilities(_get_clean_dataframe())
+    _test_possibilities(clean_df)
 
 
-def test_with_dirty_data() -> None:
+def test_with_dirty_data(dirty_df, dirty_category_df) -> None:
     """
     Defines the expected returns of the vectorizer in different settings,
     and runs the tests with a dataset containing missing values.
     """
-    _test_possibilities(_get_dirty_dataframe(categorical_dtype="object"))
-    _test_possibilities(_get_dirty_dataframe(categorical_dtype="category"))
+    _test_possibilities(dirty_df)
+    _test_possibilities(dirty_category_df)
 
 
-def test_get_feature_names_out() -> None:
-    X = _get_clean_dataframe()
+def test_get_feature_names_out(clean_df) -> None:
+    X = clean_df
 
     vec_w_pass = TableVectorizer(remainder="passthrough")
     vec_w_pass.fit(X)
@@ -259,9 +214,9 @@ def test_fit() -> None:
         assert check_is_fitted(table_vec)
 
 
-def test_check_fitted_table_vectorizer() -> None:
+def test_check_fitted_table_vectorizer(clean_df) -> None:
     """Test that calling transform before fit raises an error"""
-    X = _get_clean_dataframe()
+    X = clean_df.copy(deep=True)
     tv = TableVectorizer()
     with pytest.raises(NotFittedError):
         tv.transform(X)
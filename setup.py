@@ -41,10 +41,16 @@ base_extras_heavy = {
 
 base_extras = {**base_extras_light, **base_extras_heavy}
 
+#CUDA 12 RAPIDS wheel names (unpinned), installable via --extra-index-url=https://pypi.nvidia.com
+gpu_extras = {
+  'gpu': ['cudf-cu12', 'cuml-cu12', 'cupy-cuda12x'],
+}
+
 extras_require = {
 
   **base_extras_light,
   **base_extras_heavy,
+  **gpu_extras,
   **dev_extras,
 
   #kitchen sink for GPU users -- recommended